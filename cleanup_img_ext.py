@@ -5,29 +5,63 @@ from __future__ import annotations
 import argparse
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 
+# Image signatures keyed by their first four bytes (big-endian)
+MAGIC_EXTS = {
+    0x89504E47: ".png",  # \x89PNG
+    0x47494638: ".gif",  # GIF8 (GIF87a / GIF89a)
+}
+JPEG_MAGIC = 0xFFD8FF  # followed by any marker byte
+
+DEFAULT_WORKERS = 16
+
+
+def sniff_ext(data: bytes) -> str | None:
+    sig = int.from_bytes(data[:4], "big")
+    ext = MAGIC_EXTS.get(sig)
+    if ext:
+        return ext
+    if sig >> 8 == JPEG_MAGIC:
+        return ".jpg"
+    if data[0:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
 
 def detect_ext(path: Path) -> str | None:
     try:
-        data = path.read_bytes()[:12]
+        with path.open("rb") as f:
+            data = f.read(12)
     except Exception:
         return None
-    if data.startswith(b"\x89PNG\r\n\x1a\n"):
-        return ".png"
-    if data.startswith(b"\xff\xd8\xff"):
-        return ".jpg"
-    if data.startswith(b"GIF87a") or data.startswith(b"GIF89a"):
-        return ".gif"
-    if len(data) >= 12 and data[0:4] == b"RIFF" and data[8:12] == b"WEBP":
-        return ".webp"
-    return None
+    return sniff_ext(data)
+
+
+@cache
+def _list_files(dir_path: str) -> frozenset[str]:
+    # Safe to cache: Markdown is only rewritten after every rename has happened
+    return frozenset(f.name for f in Path(dir_path).iterdir() if f.is_file())
+
+
+@cache
+def _sorted_files(dir_path: str) -> tuple[str, ...]:
+    # Deterministic order for the prefix fallback; membership checks use the frozenset
+    return tuple(sorted(_list_files(dir_path)))
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument("--export-root", default="export", help="Export root (default: export)")
     p.add_argument("--debug", action="store_true", help="Debug output")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Parallel header reads when detecting image types (default: {DEFAULT_WORKERS})",
+    )
     return p.parse_args()
 
 
@@ -37,12 +71,19 @@ def main() -> int:
     if not root.exists():
         print(f"Export root not found: {root}")
         return 1
+    if args.workers < 1:
+        print(f"--workers must be at least 1, got {args.workers}")
+        return 1
 
     # Map old relative path -> new relative path
     rewrites: dict[str, str] = {}
 
-    for img in root.rglob("*.img"):
-        ext = detect_ext(img)
+    # Sniff headers in parallel (the reads are syscall-bound); rename on this thread
+    img_files = list(root.rglob("*.img"))
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        detected = list(executor.map(detect_ext, img_files))
+
+    for img, ext in zip(img_files, detected):
         if not ext:
             continue
         new_path = img.with_suffix(ext)
@@ -60,27 +101,42 @@ def main() -> int:
     updated_files = 0
     # Find any .img path inside markdown (relative paths)
     pattern = re.compile(r'(?P<path>(?:\.\./|\./)?[^\s"\'<>]+\.img)')
+    # All known renames in one alternation; longest first so a path wins over any suffix of it
+    rewrite_pattern = None
+    if rewrites:
+        rewrite_pattern = re.compile("|".join(re.escape(k) for k in sorted(rewrites, key=len, reverse=True)))
     for md in md_files:
-        text = md.read_text(encoding="utf-8", errors="replace")
+        raw = md.read_bytes()
+        # Rewrite keys and fallback matches all end in ".img": files without it need no decode or regex
+        if b".img" not in raw:
+            if args.debug:
+                print(f"[DEBUG] {md}: 0 .img refs")
+            continue
+        text = raw.decode("utf-8", errors="replace")
         updated = text
-        # First apply known rewrites
-        for old_rel, new_rel in rewrites.items():
-            updated = updated.replace(old_rel, new_rel)
-            updated = updated.replace("../" + old_rel, "../" + new_rel)
-            updated = updated.replace("./" + old_rel, "./" + new_rel)
+        # First apply known rewrites (covers "./" and "../" prefixed refs too)
+        if rewrite_pattern:
+            updated = rewrite_pattern.sub(lambda m: rewrites[m.group(0)], updated)
         # Then fix any remaining .img references by checking the filesystem
         # Replace any .img paths by checking filesystem near the markdown file
         matches = set(pattern.findall(updated))
         if args.debug:
             print(f"[DEBUG] {md}: {len(matches)} .img refs")
         for rel_path in matches:
-            candidate_base = (md.parent / rel_path).resolve()
+            # abspath instead of resolve(): no per-component lstat, and the listing follows symlinks anyway
+            candidate_base = Path(os.path.abspath(md.parent / rel_path))
             if args.debug:
                 print(f"[DEBUG] resolve {rel_path} -> {candidate_base}")
+            dir_path = candidate_base.parent
+            try:
+                siblings = _list_files(str(dir_path))
+            except OSError:
+                continue
+            # Look candidates up in the cached listing instead of stat-ing each extension
             replaced = False
             for ext in ext_candidates:
                 cand = candidate_base.with_suffix(ext)
-                if cand.exists():
+                if cand.name in siblings:
                     new_rel = rel_path[:-4] + ext
                     updated = updated.replace(rel_path, new_rel)
                     replaced = True
@@ -90,20 +146,17 @@ def main() -> int:
             if replaced:
                 continue
             # Fallback: match by numeric prefix (e.g., 001_) in same directory
-            try:
-                prefix = candidate_base.name.split("_", 1)[0] + "_"
-                dir_path = candidate_base.parent
-                for file in dir_path.iterdir():
-                    if file.is_file() and file.name.startswith(prefix) and file.suffix.lower() in ext_candidates:
-                        new_rel = str(Path(rel_path).with_name(file.name)).replace("\\", "/")
-                        updated = updated.replace(rel_path, new_rel)
-                        if args.debug:
-                            print(f"[DEBUG] prefix match -> {file}")
-                        break
-            except Exception:
-                pass
+            prefix = candidate_base.name.split("_", 1)[0] + "_"
+            for name in _sorted_files(str(dir_path)):
+                if name.startswith(prefix) and os.path.splitext(name)[1].lower() in ext_candidates:
+                    new_rel = str(Path(rel_path).with_name(name)).replace("\\", "/")
+                    updated = updated.replace(rel_path, new_rel)
+                    if args.debug:
+                        print(f"[DEBUG] prefix match -> {dir_path / name}")
+                    break
         if updated != text:
-            md.write_text(updated, encoding="utf-8")
+            # Bytes in, bytes out: line endings are written back exactly as they were read
+            md.write_bytes(updated.encode("utf-8"))
             updated_files += 1
 
     if rewrites:
@@ -9,16 +9,25 @@ Requires Playwright with a persistent profile (user logs in once).
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import APIRequestContext, async_playwright
+
+DEFAULT_CONCURRENCY = 16
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Download GitHub attachments via browser session")
     p.add_argument("--out-root", default="export", help="Export root (default: export)")
     p.add_argument("--profile-dir", default="export/browser_profile", help="Browser profile dir")
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Parallel downloads (default: {DEFAULT_CONCURRENCY})",
+    )
     return p.parse_args()
 
 
@@ -34,9 +43,58 @@ def load_missing(out_root: Path) -> list[dict[str, str]]:
     return rows
 
 
+async def fetch(req: APIRequestContext, row: dict[str, str], out_root: Path) -> bool:
+    url = row["url"]
+    repo_slug = row["repo_slug"]
+    rel = row["local_path"]
+    target = out_root / repo_slug / rel
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        resp = await req.get(url)
+        if not resp.ok:
+            return False
+        body = await resp.body()
+        if not body:
+            return False
+        target.write_bytes(body)
+        return True
+    except Exception:
+        return False
+
+
+async def download_all(rows: list[dict[str, str]], out_root: Path, profile_dir: Path, concurrency: int) -> None:
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(
+            user_data_dir=str(profile_dir),
+            headless=False,
+        )
+        page = await context.new_page()
+        await page.goto("https://github.com")
+        print("If not logged in, log in now in the opened browser.")
+        await asyncio.to_thread(input, "Press Enter to continue downloading...")
+
+        # One request context shares the logged-in cookies across all downloads
+        req = context.request
+        sem = asyncio.Semaphore(concurrency)
+
+        async def bounded_fetch(row: dict[str, str]) -> bool:
+            async with sem:
+                return await fetch(req, row, out_root)
+
+        results = await asyncio.gather(*(bounded_fetch(row) for row in rows))
+        ok = sum(results)
+        fail = len(results) - ok
+
+        print(f"Downloaded {ok} attachments, {fail} failed.")
+        await context.close()
+
+
 def main() -> int:
     args = parse_args()
     out_root = Path(args.out_root)
+    if args.concurrency < 1:
+        print(f"--concurrency must be at least 1, got {args.concurrency}")
+        return 1
     rows = load_missing(out_root)
     if not rows:
         print("No missing attachments found.")
@@ -45,43 +103,7 @@ def main() -> int:
     profile_dir = Path(args.profile_dir)
     profile_dir.mkdir(parents=True, exist_ok=True)
 
-    with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(
-            user_data_dir=str(profile_dir),
-            headless=False,
-        )
-        page = context.new_page()
-        page.goto("https://github.com")
-        print("If not logged in, log in now in the opened browser.")
-        input("Press Enter to continue downloading...")
-
-        req = context.request
-        ok = 0
-        fail = 0
-        for row in rows:
-            url = row["url"]
-            repo_slug = row["repo_slug"]
-            rel = row["local_path"]
-            target = out_root / repo_slug / rel
-            target.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                resp = req.get(url)
-                if not resp.ok:
-                    fail += 1
-                    continue
-                body = resp.body()
-                if not body:
-                    fail += 1
-                    continue
-                target.write_bytes(body)
-                ok += 1
-            except Exception:
-                fail += 1
-                continue
-
-        print(f"Downloaded {ok} attachments, {fail} failed.")
-        context.close()
-
+    asyncio.run(download_all(rows, out_root, profile_dir, args.concurrency))
     return 0
 
 
@@ -21,26 +21,47 @@ import argparse
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
-from collections.abc import Iterable, Mapping
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import cache, partial
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlsplit
-from urllib.request import Request, urlopen
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 IMG_PATTERN = re.compile(
     r"!\[[^\]]*\]\(\s*(?P<md_url>[^)\s]+)(?:\s+[\"\'][^\"\']*[\"\'])?\s*\)"
     r"|<img\b[^>]*?\bsrc=(?:(?P<html_q>[\"\'])(?P<html_url>.*?)(?P=html_q)|(?P<html_url_unq>[^>\s]+))[^>]*?>",
     re.IGNORECASE | re.DOTALL,
 )
+IMG_URL_GROUPS = frozenset({"md_url", "html_url", "html_url_unq"})
 
 PR_CONTEXT_PATTERN = re.compile(
     r"(?i)(?:\bpr\b|\bpull\s+request\b|\bpull\b|\bmerge\b)\s*#(?P<num>\d+)"
 )
 PR_URL_PATTERN_TEMPLATE = r"https?://github\.com/{owner}/{repo}/pull/(?P<num>\d+)"
 
+# Image signatures keyed by their first four bytes (big-endian)
+MAGIC_EXTS = {
+    0x89504E47: ".png",  # \x89PNG
+    0x47494638: ".gif",  # GIF8 (GIF87a / GIF89a)
+}
+JPEG_MAGIC = 0xFFD8FF  # followed by any marker byte
+
+DEFAULT_DOWNLOAD_WORKERS = 16
+HTTP_TIMEOUT = 60
+DOWNLOAD_CHUNK = 1024 * 1024
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+TOKEN_CACHE_TTL = 3600  # seconds a cached `gh auth token` result stays valid
+
 ISSUE_FIX_PATTERN = re.compile(
     r"(?i)\b(?:fixe[sd]?|close[sd]?|resolve[sd]?)\s+(?:(?P<owner>[\w.-]+)/(?P<repo>[\w.-]+))?#(?P<num>\d+)"
 )
@@ -55,8 +76,8 @@ def slugify_repo(repo: str) -> str:
 
 
 def load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # One read + bytes parse; json detects the UTF encoding itself, skipping the text-mode decoder
+    return json.loads(path.read_bytes())
 
 
 def ensure_dir(path: Path) -> None:
@@ -83,30 +104,86 @@ def filename_from_url(url: str, index: int) -> str:
     return f"{index:03d}_{name}{ext}"
 
 
+def sniff_ext(data: bytes) -> str | None:
+    sig = int.from_bytes(data[:4], "big")
+    ext = MAGIC_EXTS.get(sig)
+    if ext:
+        return ext
+    if sig >> 8 == JPEG_MAGIC:
+        return ".jpg"
+    if data[0:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
 def detect_ext_from_file(path: Path) -> str | None:
     try:
-        data = path.read_bytes()[:12]
+        with path.open("rb") as f:
+            data = f.read(12)
     except Exception:
         return None
-    if data.startswith(b"\x89PNG\r\n\x1a\n"):
-        return ".png"
-    if data.startswith(b"\xff\xd8\xff"):
-        return ".jpg"
-    if data.startswith(b"GIF87a") or data.startswith(b"GIF89a"):
-        return ".gif"
-    if len(data) >= 12 and data[0:4] == b"RIFF" and data[8:12] == b"WEBP":
-        return ".webp"
-    return None
+    return sniff_ext(data)
+
+
+def token_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA") or str(Path.home() / ".cache")
+    return Path(base) / "gh-issues-pr-export" / "token.json"
+
+
+def _gh_hosts_path() -> Path:
+    # Where gh keeps its account list; login/logout/switch/refresh rewrite it
+    if os.environ.get("GH_CONFIG_DIR"):
+        return Path(os.environ["GH_CONFIG_DIR"]) / "hosts.yml"
+    if os.environ.get("XDG_CONFIG_HOME"):
+        return Path(os.environ["XDG_CONFIG_HOME"]) / "gh" / "hosts.yml"
+    if sys.platform == "win32" and os.environ.get("APPDATA"):
+        return Path(os.environ["APPDATA"]) / "GitHub CLI" / "hosts.yml"
+    return Path.home() / ".config" / "gh" / "hosts.yml"
 
 
-def get_auth_token() -> str | None:
+def _read_cached_token(path: Path, host: str) -> str | None:
+    try:
+        cached_at = path.stat().st_mtime
+        if time.time() - cached_at >= TOKEN_CACHE_TTL:
+            return None
+        hosts_path = _gh_hosts_path()
+        if hosts_path.exists() and hosts_path.stat().st_mtime >= cached_at:
+            # gh auth state changed since the token was cached
+            return None
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("host") != host:
+        return None
+    token = data.get("token")
+    return token if isinstance(token, str) and token else None
+
+
+def _write_cached_token(path: Path, host: str, token: str) -> None:
+    try:
+        ensure_dir(path.parent)
+        # Owner-only, like gh's own hosts.yml
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"host": host, "token": token}, f)
+        os.chmod(path, 0o600)
+    except OSError:
+        pass
+
+
+def get_auth_token(cache_token: bool = False) -> str | None:
     token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
     if token:
         return token.strip()
+    # Opt-in: reuse a recent `gh auth token` result to skip spawning gh (~100 ms) in scripted loops
+    host = os.environ.get("GH_HOST") or "github.com"
+    cache_path = token_cache_path()
+    if cache_token:
+        token = _read_cached_token(cache_path, host)
+        if token:
+            return token
     # Try gh auth token if available
     try:
-        import subprocess
-
         result = subprocess.run(
             ["gh", "auth", "token"],
             check=True,
@@ -114,9 +191,13 @@ def get_auth_token() -> str | None:
             text=True,
         )
         token = result.stdout.strip()
-        return token or None
     except Exception:
         return None
+    if not token:
+        return None
+    if cache_token:
+        _write_cached_token(cache_path, host, token)
+    return token
 
 
 def _candidate_urls(url: str) -> list[str]:
@@ -168,9 +249,95 @@ def _download_with_gh(url: str, path: Path) -> bool:
     return False
 
 
-def download_image(url: str, path: Path, token: str | None) -> bool:
+# Keep-alive connections, one per (scheme, host) for each download thread
+_connections = threading.local()
+
+
+class HTTPStatusError(HTTPException):
+    # Raised after the response body was fully read, so the connection is still reusable
+    pass
+
+
+def _get_connection(scheme: str, netloc: str) -> HTTPConnection:
+    pool: dict[tuple[str, str], HTTPConnection] | None = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    key = (scheme, netloc.lower())
+    conn = pool.get(key)
+    if conn is None:
+        conn_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        conn = pool[key] = conn_cls(netloc, timeout=HTTP_TIMEOUT)
+    return conn
+
+
+def _reset_connections() -> None:
+    pool: dict[tuple[str, str], HTTPConnection] = getattr(_connections, "pool", {})
+    for conn in pool.values():
+        conn.close()
+    pool.clear()
+
+
+def _is_proxied(url: str) -> bool:
+    parsed = urlsplit(url)
+    return parsed.scheme in getproxies() and not proxy_bypass(parsed.hostname or "")
+
+
+def _http_get(url: str, headers: dict[str, str]) -> HTTPResponse:
+    # GET over a pooled connection, following redirects like urlopen does
+    for _ in range(MAX_REDIRECTS + 1):
+        parsed = urlsplit(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+        for attempt in range(2):
+            conn = _get_connection(scheme, parsed.netloc)
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                break
+            except (HTTPException, OSError):
+                # The server may have closed an idle keep-alive connection (reset, TLS EOF, ...); reconnect once
+                conn.close()
+                if attempt:
+                    raise
+        if resp.status in REDIRECT_STATUSES:
+            location = resp.getheader("Location")
+            resp.read()
+            if not location:
+                raise HTTPStatusError(f"HTTP {resp.status} without Location for {url}")
+            next_url = urljoin(url, location)
+            if urlsplit(next_url).netloc.lower() != parsed.netloc.lower():
+                # Never forward the token to another host (e.g. signed objects.githubusercontent.com URLs)
+                headers = {k: v for k, v in headers.items() if k.lower() != "authorization"}
+            url = next_url
+            continue
+        if resp.status >= 400:
+            resp.read()
+            raise HTTPStatusError(f"HTTP Error {resp.status}: {resp.reason}")
+        return resp
+    raise HTTPStatusError(f"Too many redirects for {url}")
+
+
+def _rename_to_detected_ext(path: Path) -> Path:
+    real_ext = detect_ext_from_file(path)
+    if not real_ext:
+        return path
+    new_path = path.with_suffix(real_ext)
+    try:
+        path.rename(new_path)
+    except Exception:
+        # If rename fails, keep .img
+        return path
+    return new_path
+
+
+def download_image(url: str, path: Path, token: str | None) -> Path | None:
+    # Returns where the file ended up: a .img target is renamed to the sniffed image type
     if path.exists():
-        return True
+        return _rename_to_detected_ext(path) if path.suffix.lower() == ".img" else path
     headers = {
         "User-Agent": "gh-issue-export/1.0",
         "Accept": "application/octet-stream",
@@ -181,25 +348,38 @@ def download_image(url: str, path: Path, token: str | None) -> bool:
     last_exc: Exception | None = None
     for candidate in _candidate_urls(url):
         try:
-            req = Request(candidate, headers=headers)
-            with urlopen(req) as resp:
-                ensure_dir(path.parent)
-                with path.open("wb") as f:
-                    chunk = resp.read(1024 * 1024)
-                    while chunk:
-                        f.write(chunk)
-                        chunk = resp.read(1024 * 1024)
-            return True
+            if _is_proxied(candidate):
+                resp = urlopen(Request(candidate, headers=headers), timeout=HTTP_TIMEOUT)
+            else:
+                resp = _http_get(candidate, headers)
+            with resp:
+                # Sniff the type from the first chunk so the file is written under its final name
+                first = resp.read(DOWNLOAD_CHUNK)
+                final_path = path
+                if path.suffix.lower() == ".img":
+                    real_ext = sniff_ext(first[:12])
+                    if real_ext:
+                        final_path = path.with_suffix(real_ext)
+                ensure_dir(final_path.parent)
+                with final_path.open("wb") as f:
+                    f.write(first)
+                    shutil.copyfileobj(resp, f, DOWNLOAD_CHUNK)
+            return final_path
+        except HTTPStatusError as exc:
+            last_exc = exc
+            continue
         except Exception as exc:
             last_exc = exc
+            # A half-read response leaves its connection unusable
+            _reset_connections()
             continue
     # Fallback for github.com/user-attachments assets using gh client (auth cookies/token)
     if _is_user_attachment(url):
         if _download_with_gh(url, path):
-            return True
+            return _rename_to_detected_ext(path) if path.suffix.lower() == ".img" else path
     if not _is_user_attachment(url):
         eprint(f"WARN: Failed to download {url}: {last_exc}")
-    return False
+    return None
 
 
 class ImageStats:
@@ -218,65 +398,124 @@ class ImageTracker:
         token: str | None,
         stats: ImageStats,
         missing_cb,
+        executor: Executor | None = None,
+        url_cache: dict[str, Path] | None = None,
     ) -> None:
         self.assets_dir = assets_dir
         self.md_dir = md_dir
         self.token = token
         self.stats = stats
         self.missing_cb = missing_cb
+        self.executor = executor
+        # Shared across every tracker of a repo: URL -> downloaded file, so reused assets are fetched once
+        self.url_cache = url_cache if url_cache is not None else {}
         self.counter = 0
         self.url_to_rel: dict[str, str] = {}
 
-    def get_local(self, url: str) -> str:
-        if url in self.url_to_rel:
-            return self.url_to_rel[url]
+    def _rel(self, path: Path) -> str:
+        rel = os.path.relpath(path, self.md_dir)
+        return rel.replace(os.sep, "/")
+
+    def _from_cache(self, url: str) -> str | None:
+        cached = self.url_cache.get(url)
+        if cached is None:
+            return None
+        rel = self._rel(cached)
+        self.url_to_rel[url] = rel
+        return rel
+
+    def _next_path(self, url: str) -> Path:
         self.counter += 1
         self.stats.attempted += 1
-        filename = filename_from_url(url, self.counter)
-        abs_path = self.assets_dir / filename
-        ok = download_image(url, abs_path, self.token)
-        if not ok:
+        return self.assets_dir / filename_from_url(url, self.counter)
+
+    def _finish(self, url: str, abs_path: Path, saved_path: Path | None) -> str:
+        if saved_path is None:
             self.stats.failed += 1
-            rel = os.path.relpath(abs_path, self.md_dir)
-            rel = rel.replace(os.sep, "/")
+            rel = self._rel(abs_path)
             self.url_to_rel[url] = rel
             if self.missing_cb:
                 self.missing_cb(url, rel)
             return rel
-        # If extension is .img, try to detect real type and rename
-        if abs_path.suffix.lower() == ".img":
-            real_ext = detect_ext_from_file(abs_path)
-            if real_ext:
-                new_path = abs_path.with_suffix(real_ext)
-                try:
-                    abs_path.rename(new_path)
-                    abs_path = new_path
-                except Exception:
-                    # If rename fails, keep .img
-                    pass
         self.stats.downloaded += 1
-        rel = os.path.relpath(abs_path, self.md_dir)
-        rel = rel.replace(os.sep, "/")
+        self.url_cache[url] = saved_path
+        rel = self._rel(saved_path)
         self.url_to_rel[url] = rel
         return rel
 
+    def prefetch(self, urls: Iterable[str]) -> None:
+        # Filenames are assigned in first-seen order so numbering matches a serial run
+        planned: list[tuple[str, Path]] = []
+        seen: set[str] = set()
+        for url in urls:
+            if url in self.url_to_rel or url in seen or self._from_cache(url) is not None:
+                continue
+            seen.add(url)
+            planned.append((url, self._next_path(url)))
+        if not planned:
+            return
+        if self.executor is None:
+            results: Iterable[Path | None] = [download_image(url, path, self.token) for url, path in planned]
+        else:
+            results = self.executor.map(lambda item: download_image(item[0], item[1], self.token), planned)
+        for (url, path), saved_path in zip(planned, results):
+            self._finish(url, path, saved_path)
+
+    def get_local(self, url: str) -> str:
+        if url in self.url_to_rel:
+            return self.url_to_rel[url]
+        rel = self._from_cache(url)
+        if rel is not None:
+            return rel
+        abs_path = self._next_path(url)
+        return self._finish(url, abs_path, download_image(url, abs_path, self.token))
+
+
+def _remote_url_group(match: re.Match) -> str | None:
+    # Each IMG_PATTERN alternative ends with its URL group, so lastgroup names the one that matched
+    group = match.lastgroup
+    if group not in IMG_URL_GROUPS:
+        return None
+    url = match.group(group)
+    if not url.startswith("http://") and not url.startswith("https://"):
+        return None
+    return group
+
+
+def may_contain_image(text: str) -> bool:
+    # Every IMG_PATTERN match contains "](" (Markdown) or "<" (HTML); most bodies have neither
+    return "](" in text or "<" in text
+
+
+def iter_image_urls(text: str) -> Iterator[str]:
+    if not text or not may_contain_image(text):
+        return
+    for match in IMG_PATTERN.finditer(text):
+        group = _remote_url_group(match)
+        if group:
+            yield match.group(group)
+
 
 def replace_images(text: str, tracker: ImageTracker) -> str:
     if not text:
         return ""
-
-    def repl(match: re.Match) -> str:
-        url = match.group("md_url") or match.group("html_url") or match.group("html_url_unq")
-        if not url:
-            return match.group(0)
-        if url.startswith("data:"):
-            return match.group(0)
-        if not url.startswith("http://") and not url.startswith("https://"):
-            return match.group(0)
-        local = tracker.get_local(url)
-        return match.group(0).replace(url, local, 1)
-
-    return IMG_PATTERN.sub(repl, text)
+    if not may_contain_image(text):
+        return text
+    # Splice local paths in at the URL spans instead of re-searching each matched tag
+    out: list[str] = []
+    pos = 0
+    for match in IMG_PATTERN.finditer(text):
+        group = _remote_url_group(match)
+        if not group:
+            continue
+        start, end = match.span(group)
+        out.append(text[pos:start])
+        out.append(tracker.get_local(match.group(group)))
+        pos = end
+    if not out:
+        return text
+    out.append(text[pos:])
+    return "".join(out)
 
 
 def parse_iso(dt: str) -> tuple[str, float]:
@@ -293,13 +532,13 @@ def parse_iso(dt: str) -> tuple[str, float]:
         return (dt, float("inf"))
 
 
+def comment_timestamp(comment: Mapping[str, Any]) -> float:
+    return parse_iso(comment.get("created_at") or comment.get("createdAt") or "")[1]
+
+
 def sort_comments(comments: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    indexed = []
-    for idx, c in enumerate(comments):
-        _, ts = parse_iso(c.get("created_at") or c.get("createdAt") or "")
-        indexed.append((ts, idx, c))
-    indexed.sort(key=lambda x: (x[0], x[1]))
-    return [c for _, _, c in indexed]
+    # sorted() is stable, so equal timestamps keep their original order without an index tiebreak
+    return sorted(comments, key=comment_timestamp)
 
 
 def get_author_login(comment: Mapping[str, Any]) -> str:
@@ -362,20 +601,28 @@ def load_comments(path: Path) -> list[dict[str, Any]]:
     return []
 
 
+@cache
+def pr_url_pattern(owner: str, repo: str) -> re.Pattern:
+    return re.compile(PR_URL_PATTERN_TEMPLATE.format(owner=re.escape(owner), repo=re.escape(repo)), re.IGNORECASE)
+
+
 def find_related_prs(texts: Iterable[str], pr_numbers: set, owner: str, repo: str) -> list[int]:
     related = set()
-    url_pat = re.compile(PR_URL_PATTERN_TEMPLATE.format(owner=re.escape(owner), repo=re.escape(repo)), re.IGNORECASE)
+    url_pat = pr_url_pattern(owner, repo)
     for text in texts:
         if not text:
             continue
-        for m in url_pat.finditer(text):
-            num = int(m.group("num"))
-            if num in pr_numbers:
-                related.add(num)
-        for m in PR_CONTEXT_PATTERN.finditer(text):
-            num = int(m.group("num"))
-            if num in pr_numbers:
-                related.add(num)
+        # Substring checks are C-speed and exact: each pattern needs its literal to match at all
+        if "://" in text:
+            for m in url_pat.finditer(text):
+                num = int(m.group("num"))
+                if num in pr_numbers:
+                    related.add(num)
+        if "#" in text:
+            for m in PR_CONTEXT_PATTERN.finditer(text):
+                num = int(m.group("num"))
+                if num in pr_numbers:
+                    related.add(num)
     return sorted(related)
 
 
@@ -415,18 +662,24 @@ def write_issue_md(
     token: str | None,
     stats: ImageStats,
     missing_cb,
+    executor: Executor | None = None,
+    url_cache: dict[str, Path] | None = None,
 ) -> None:
     num = issue["number"]
     md_path = out_dir / f"ISSUE-{num}.md"
     assets_dir = assets_root / str(num)
-    tracker = ImageTracker(assets_dir, md_path.parent, token, stats, missing_cb)
+    tracker = ImageTracker(assets_dir, md_path.parent, token, stats, missing_cb, executor, url_cache)
+
+    comments_sorted = sort_comments(comments)
+
+    # Download every image up front so the fetches overlap, then substitute from the cache
+    bodies = [issue["body"]] + [c.get("body") or "" for c in comments_sorted]
+    tracker.prefetch(url for body in bodies for url in iter_image_urls(body))
 
     desc = replace_images(issue["body"], tracker)
     if not desc.strip():
         desc = "_No description_"
 
-    comments_sorted = sort_comments(comments)
-
     comment_blocks = []
     for c in comments_sorted:
         author = get_author_login(c)
@@ -439,30 +692,32 @@ def write_issue_md(
 
     related_section = format_related_links(related_prs, f"{repo_url}/pull", "PR")
 
-    content = [
-        f"# Issue #{num}: {issue['title']}",
-        "",
-        "- URL: " + issue["url"],
-        "- State: " + issue["state"],
-        "- Created: " + issue["created_at"],
-        "- Updated: " + issue["updated_at"],
-        "",
-        "## Description",
-        "",
-        desc,
-        "",
-        "## Related PRs",
-        "",
-        related_section,
-        "",
-        "## Comments",
-        "",
-        "\n\n".join(comment_blocks) if comment_blocks else "_No comments_",
-        "",
-    ]
+    comments_section = "\n\n".join(comment_blocks) if comment_blocks else "_No comments_"
+
+    content = (
+        f"# Issue #{num}: {issue['title']}\n"
+        "\n"
+        f"- URL: {issue['url']}\n"
+        f"- State: {issue['state']}\n"
+        f"- Created: {issue['created_at']}\n"
+        f"- Updated: {issue['updated_at']}\n"
+        "\n"
+        "## Description\n"
+        "\n"
+        f"{desc}\n"
+        "\n"
+        "## Related PRs\n"
+        "\n"
+        f"{related_section}\n"
+        "\n"
+        "## Comments\n"
+        "\n"
+        f"{comments_section}\n"
+    )
 
     ensure_dir(md_path.parent)
-    md_path.write_text("\n".join(content), encoding="utf-8")
+    # Bytes keep "\n" line endings on every platform (text mode would write CRLF on Windows)
+    md_path.write_bytes(content.encode("utf-8"))
 
 
 def write_pr_md(
@@ -476,21 +731,27 @@ def write_pr_md(
     token: str | None,
     stats: ImageStats,
     missing_cb,
+    executor: Executor | None = None,
+    url_cache: dict[str, Path] | None = None,
 ) -> None:
     num = pr["number"]
     md_path = out_dir / f"PR-{num}.md"
     assets_dir = assets_root / str(num)
-    tracker = ImageTracker(assets_dir, md_path.parent, token, stats, missing_cb)
-
-    desc = replace_images(pr["body"], tracker)
-    if not desc.strip():
-        desc = "_No description_"
+    tracker = ImageTracker(assets_dir, md_path.parent, token, stats, missing_cb, executor, url_cache)
 
     combined_comments = []
     combined_comments.extend(issue_comments or [])
     combined_comments.extend(review_comments or [])
     combined_sorted = sort_comments(combined_comments)
 
+    # Download every image up front so the fetches overlap, then substitute from the cache
+    bodies = [pr["body"]] + [c.get("body") or "" for c in combined_sorted]
+    tracker.prefetch(url for body in bodies for url in iter_image_urls(body))
+
+    desc = replace_images(pr["body"], tracker)
+    if not desc.strip():
+        desc = "_No description_"
+
     comment_blocks = []
     for c in combined_sorted:
         author = get_author_login(c)
@@ -503,33 +764,41 @@ def write_pr_md(
 
     related_section = format_related_links(related_issues, f"{repo_url}/issues", "Issue")
 
-    content = [
-        f"# PR #{num}: {pr['title']}",
-        "",
-        "- URL: " + pr["url"],
-        "- State: " + pr["state"],
-        "- Created: " + pr["created_at"],
-        "- Updated: " + pr["updated_at"],
-        "",
-        "## Description",
-        "",
-        desc,
-        "",
-        "## Related Issues",
-        "",
-        related_section,
-        "",
-        "## Comments",
-        "",
-        "\n\n".join(comment_blocks) if comment_blocks else "_No comments_",
-        "",
-    ]
+    comments_section = "\n\n".join(comment_blocks) if comment_blocks else "_No comments_"
+
+    content = (
+        f"# PR #{num}: {pr['title']}\n"
+        "\n"
+        f"- URL: {pr['url']}\n"
+        f"- State: {pr['state']}\n"
+        f"- Created: {pr['created_at']}\n"
+        f"- Updated: {pr['updated_at']}\n"
+        "\n"
+        "## Description\n"
+        "\n"
+        f"{desc}\n"
+        "\n"
+        "## Related Issues\n"
+        "\n"
+        f"{related_section}\n"
+        "\n"
+        "## Comments\n"
+        "\n"
+        f"{comments_section}\n"
+    )
 
     ensure_dir(md_path.parent)
-    md_path.write_text("\n".join(content), encoding="utf-8")
+    # Bytes keep "\n" line endings on every platform (text mode would write CRLF on Windows)
+    md_path.write_bytes(content.encode("utf-8"))
 
 
-def process_repo(repo: str, raw_root: Path, out_root: Path, token: str | None) -> None:
+def process_repo(
+    repo: str,
+    raw_root: Path,
+    out_root: Path,
+    token: str | None,
+    workers: int = DEFAULT_DOWNLOAD_WORKERS,
+) -> None:
     owner, name = repo.split("/", 1)
     slug = slugify_repo(repo)
     raw_dir = raw_root / slug
@@ -569,6 +838,7 @@ def process_repo(repo: str, raw_root: Path, out_root: Path, token: str | None) -
     pr_review_comments_dir = raw_dir / "pr_review_comments"
 
     stats = ImageStats()
+    url_cache: dict[str, Path] = {}
     missing: list[dict[str, str]] = []
     total_items = len(issues) + len(prs)
     processed = 0
@@ -599,51 +869,56 @@ def process_repo(repo: str, raw_root: Path, out_root: Path, token: str | None) -
             )
         return _cb
 
-    for issue in issues:
-        num = issue["number"]
-        comments_path = issue_comments_dir / f"ISSUE-{num}.json"
-        comments = load_comments(comments_path)
-        related_prs = find_related_prs(
-            [issue.get("body") or ""] + [c.get("body") or "" for c in comments],
-            pr_numbers,
-            owner,
-            name,
-        )
-        write_issue_md(
-            issue,
-            comments,
-            issues_dir,
-            assets_issues,
-            related_prs,
-            repo_url,
-            token,
-            stats,
-            make_missing_cb("issue", num),
-        )
-        processed += 1
-        maybe_log_progress()
-
-    for pr in prs:
-        num = pr["number"]
-        issue_comments_path = pr_issue_comments_dir / f"PR-{num}.json"
-        review_comments_path = pr_review_comments_dir / f"PR-{num}.json"
-        issue_comments = load_comments(issue_comments_path)
-        review_comments = load_comments(review_comments_path)
-        related_issues = find_related_issues(pr.get("body") or "", issue_numbers, owner, name)
-        write_pr_md(
-            pr,
-            issue_comments,
-            review_comments,
-            prs_dir,
-            assets_prs,
-            related_issues,
-            repo_url,
-            token,
-            stats,
-            make_missing_cb("pr", num),
-        )
-        processed += 1
-        maybe_log_progress()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for issue in issues:
+            num = issue["number"]
+            comments_path = issue_comments_dir / f"ISSUE-{num}.json"
+            comments = load_comments(comments_path)
+            related_prs = find_related_prs(
+                [issue.get("body") or ""] + [c.get("body") or "" for c in comments],
+                pr_numbers,
+                owner,
+                name,
+            )
+            write_issue_md(
+                issue,
+                comments,
+                issues_dir,
+                assets_issues,
+                related_prs,
+                repo_url,
+                token,
+                stats,
+                make_missing_cb("issue", num),
+                executor,
+                url_cache,
+            )
+            processed += 1
+            maybe_log_progress()
+
+        for pr in prs:
+            num = pr["number"]
+            issue_comments_path = pr_issue_comments_dir / f"PR-{num}.json"
+            review_comments_path = pr_review_comments_dir / f"PR-{num}.json"
+            issue_comments = load_comments(issue_comments_path)
+            review_comments = load_comments(review_comments_path)
+            related_issues = find_related_issues(pr.get("body") or "", issue_numbers, owner, name)
+            write_pr_md(
+                pr,
+                issue_comments,
+                review_comments,
+                prs_dir,
+                assets_prs,
+                related_issues,
+                repo_url,
+                token,
+                stats,
+                make_missing_cb("pr", num),
+                executor,
+                url_cache,
+            )
+            processed += 1
+            maybe_log_progress()
 
     print(
         f"[{repo}] Images: downloaded {stats.downloaded}/{stats.attempted} "
@@ -652,9 +927,9 @@ def process_repo(repo: str, raw_root: Path, out_root: Path, token: str | None) -
     )
     if missing:
         missing_path = out_root / f"missing_attachments_{slugify_repo(repo)}.jsonl"
-        with missing_path.open("w", encoding="utf-8") as f:
-            for row in missing:
-                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        # One encoder and one write for the whole file
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        missing_path.write_text("".join(encode(row) + "\n" for row in missing), encoding="utf-8")
         print(f"[{repo}] Missing attachments list: {missing_path}", flush=True)
 
 
@@ -676,20 +951,45 @@ def parse_args() -> argparse.Namespace:
         default="export",
         help="Root folder for Markdown output (default: export)",
     )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_DOWNLOAD_WORKERS,
+        help=f"Concurrent image downloads per repo (default: {DEFAULT_DOWNLOAD_WORKERS})",
+    )
+    p.add_argument(
+        "--cache-token",
+        action="store_true",
+        help="Cache the `gh auth token` result on disk (plain text, owner-only) for up to an hour",
+    )
     return p.parse_args()
 
 
 def main() -> int:
     args = parse_args()
-    token = get_auth_token()
+    token = get_auth_token(args.cache_token)
     raw_root = Path(args.raw_root)
     out_root = Path(args.out_root)
+    if args.workers < 1:
+        eprint(f"ERROR: --workers must be at least 1, got {args.workers}")
+        return 1
 
     for repo in args.repo:
         if "/" not in repo:
             eprint(f"ERROR: Invalid repo format: {repo}")
             return 1
-        process_repo(repo, raw_root, out_root, token)
+
+    jobs = min(len(args.repo), os.cpu_count() or 1)
+    if jobs == 1:
+        for repo in args.repo:
+            process_repo(repo, raw_root, out_root, token, args.workers)
+        return 0
+
+    # Repos are independent; one process each sidesteps the GIL for the Markdown/regex work.
+    # HTTP connections are thread-local, so every worker process opens its own.
+    export_repo = partial(process_repo, raw_root=raw_root, out_root=out_root, token=token, workers=args.workers)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        list(pool.map(export_repo, args.repo))
 
     return 0
 